@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import date as _date
 from typing import Any
 
@@ -44,13 +45,37 @@ def _interval_overlap(a_start: int, a_end: int, b_start: int, b_end: int) -> boo
     return a_start < b_end and b_start < a_end
 
 
-def _exclude_applies_to(exclude: dict[str, Any], location_id: str) -> bool:
-    """Excludes may target one location, a list, or be club-wide. Treat unscoped as club-wide."""
+def _busy_mask(
+    intervals: list[tuple[int, int]], window_start: int, n_slots: int
+) -> int:
+    """Bitmask over slot indices: bit i is set when slot i overlaps any interval."""
+    mask = 0
+    for b_start, b_end in intervals:
+        lo = max(0, (b_start - window_start) // SLOT_MINUTES)
+        hi = min(n_slots, -((window_start - b_end) // SLOT_MINUTES))
+        if hi > lo:
+            mask |= ((1 << (hi - lo)) - 1) << lo
+    return mask
+
+
+def _exclude_targets(exclude: dict[str, Any]) -> list[str] | None:
+    """Excludes may target one location, a list, or be club-wide. None means club-wide."""
     if "locationId" in exclude:
-        return exclude["locationId"] == location_id
+        return [exclude["locationId"]]
     if "locations" in exclude and isinstance(exclude["locations"], list):
-        return location_id in exclude["locations"]
-    return True
+        return exclude["locations"]
+    return None
+
+
+def open_window(open_hours: dict[str, Any], iso_date: str) -> tuple[int, int] | None:
+    """Return the (from, to) minutes the club is open on `iso_date`, or None if closed."""
+    weekday = WEEKDAYS[_date.fromisoformat(iso_date).weekday()]
+    day_hours = open_hours.get(weekday) or {}
+    open_from = day_hours.get("from")
+    open_to = day_hours.get("to")
+    if not open_from or not open_to:
+        return None
+    return _parse_hms(open_from), _parse_hms(open_to)
 
 
 def _booking_minutes(b: dict[str, Any]) -> tuple[int, int] | None:
@@ -76,55 +101,51 @@ def build_availability(
     not generated. A slot is available iff no booking AND no applicable exclude
     overlaps it.
     """
-    weekday = WEEKDAYS[_date.fromisoformat(iso_date).weekday()]
-    day_hours = open_hours.get(weekday) or {}
-    open_from = day_hours.get("from")
-    open_to = day_hours.get("to")
-    if not open_from or not open_to:
+    window = open_window(open_hours, iso_date)
+    if window is None:
         return []
 
-    window_start = _parse_hms(open_from)
-    window_end = _parse_hms(open_to)
+    window_start, window_end = window
     base_slots = _slots_for_window(window_start, window_end)
 
+    # Bucket bookings and excludes by location in one pass each, rather than
+    # rescanning both lists for every court. Both just mark time as busy.
+    busy_by_loc: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    club_wide: list[tuple[int, int]] = []
+    for b in bookings:
+        interval = _booking_minutes(b)
+        if interval is not None and b.get("locationId"):
+            busy_by_loc[b["locationId"]].append(interval)
+    for e in excludes:
+        interval = _booking_minutes(e)
+        if interval is None:
+            continue
+        targets = _exclude_targets(e)
+        if targets is None:
+            club_wide.append(interval)
+        else:
+            for target in targets:
+                busy_by_loc[target].append(interval)
+
+    # Slot labels are the same for every court; format them once.
+    labels = [(_fmt(s_start), _fmt(s_end)) for s_start, s_end in base_slots]
+    n_slots = len(labels)
+    club_mask = _busy_mask(club_wide, window_start, n_slots)
+
     out: list[dict[str, Any]] = []
     for loc in locations:
         if not loc.get("isEnabled", True):
             continue
 
         loc_id = loc["id"]
-        loc_bookings: list[tuple[int, int]] = []
-        for b in bookings:
-            if b.get("locationId") != loc_id:
-                continue
-            interval = _booking_minutes(b)
-            if interval is not None:
-                loc_bookings.append(interval)
-
-        loc_excludes: list[tuple[int, int]] = []
-        for e in excludes:
-            if not _exclude_applies_to(e, loc_id):
-                continue
-            interval = _booking_minutes(e)
-            if interval is not None:
-                loc_excludes.append(interval)
-
-        slots = []
-        for s_start, s_end in base_slots:
-            available = not any(
-                _interval_overlap(s_start, s_end, b_start, b_end)
-                for b_start, b_end in loc_bookings
-            ) and not any(
-                _interval_overlap(s_start, s_end, e_start, e_end)
-                for e_start, e_end in loc_excludes
-            )
-            slots.append(
-                {
-                    "start": _fmt(s_start),
-                    "end": _fmt(s_end),
-                    "available": available,
-                }
-            )
+        busy = club_mask | _busy_mask(
+            busy_by_loc.get(loc_id, []), window_start, n_slots
+        )
+
+        slots = [
+            {"start": start, "end": end, "available": not (busy >> i) & 1}
+            for i, (start, end) in enumerate(labels)
+        ]
 
         out.append(
             {
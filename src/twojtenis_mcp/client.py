@@ -7,6 +7,10 @@ import httpx
 
 from .models import ApiErrorException
 
+# httpx drops idle keep-alive connections after 5 s by default, shorter than
+# the usual gap between an agent's tool calls. Keep them around for a minute.
+_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0)
+
 
 class ApiClient:
     """Thin async HTTP wrapper for the new TwojTenis JSON API.
@@ -14,11 +18,26 @@ class ApiClient:
     Callers pass a fully-qualified URL plus the `access_token`. The client does
     not own host routing — endpoints decide whether to hit the main API host
     or a per-club tech-group host (resolved via `TechGroupResolver`).
+
+    One `httpx.AsyncClient` is created lazily and reused for every request so
+    keep-alive connections (and their TLS sessions) survive across tool calls.
+    Call `aclose()` on shutdown.
     """
 
     def __init__(self, main_base: str, timeout: float = 30.0) -> None:
         self.main_base = main_base.rstrip("/")
         self._timeout = timeout
+        self._http: httpx.AsyncClient | None = None
+
+    def _session(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=self._timeout, limits=_LIMITS)
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def get(
         self,
@@ -53,10 +72,9 @@ class ApiClient:
             headers["Content-Type"] = "application/json"
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.request(
-                    method, url, headers=headers, params=params, json=json
-                )
+            resp = await self._session().request(
+                method, url, headers=headers, params=params, json=json
+            )
         except httpx.RequestError as exc:
             raise ApiErrorException(
                 "REQUEST_FAILED", f"network error: {exc}"
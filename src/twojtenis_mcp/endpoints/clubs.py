@@ -1,23 +1,80 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import time
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from ..client import ApiClient
-from ..models import Club
+from ..models import ApiErrorException, Club
 from ..router import ApiRouter
 
+logger = logging.getLogger(__name__)
+
+_CLUBS = TypeAdapter(list[Club])
+_CACHE_TTL = float(os.environ.get("TWOJTENIS_CLUBS_CACHE_TTL", "3600"))
+_STALE_RETRY_DELAY = 60.0
+
 
 class ClubsEndpoint:
-    """Read-only access to /api/v1/Clubs and per-club details."""
+    """Read-only access to /api/v1/Clubs and per-club details.
+
+    The club list changes on the order of days, so it is cached with a TTL
+    (default 3600 s, override via TWOJTENIS_CLUBS_CACHE_TTL). If a refresh
+    fails, the last good list is served and the next attempt is deferred by
+    a short retry interval rather than made on every call.
+    """
 
     def __init__(self, client: ApiClient, router: ApiRouter) -> None:
         self._client = client
         self._router = router
+        self._clubs: list[dict[str, Any]] | None = None
+        self._clubs_expires_at = 0.0
+        self._refreshing: asyncio.Task[list[dict[str, Any]]] | None = None
+
+    def _fresh(self) -> list[dict[str, Any]] | None:
+        if self._clubs is not None and time.monotonic() < self._clubs_expires_at:
+            return self._clubs
+        return None
 
     async def list_clubs(self) -> list[dict[str, Any]]:
+        clubs = self._fresh()
+        if clubs is None:
+            # Concurrent callers (e.g. a burst of bookings) await one in-flight
+            # refresh and share its outcome, whether that is a list or an error.
+            if self._refreshing is None:
+                self._refreshing = asyncio.ensure_future(self._refresh_shared())
+            clubs = await asyncio.shield(self._refreshing)
+        # Hand out a fresh list so callers can't extend or reorder the cache;
+        # the club dicts themselves are shared and must be treated as read-only.
+        return list(clubs)
+
+    async def _refresh_shared(self) -> list[dict[str, Any]]:
+        try:
+            return await self._refresh()
+        finally:
+            self._refreshing = None
+
+    async def _refresh(self) -> list[dict[str, Any]]:
         url = self._router.catalog_url("/api/v1/Clubs")
-        raw = await self._client.get(url, access_token=None) or []
-        return [Club.model_validate(c).model_dump(by_alias=False) for c in raw]
+        try:
+            raw = await self._client.get(url, access_token=None) or []
+        except ApiErrorException as exc:
+            if self._clubs is None:
+                raise
+            logger.warning("club list refresh failed, serving stale copy: %s", exc)
+            self._clubs_expires_at = time.monotonic() + _STALE_RETRY_DELAY
+            return self._clubs
+        self._clubs = _CLUBS.dump_python(_CLUBS.validate_python(raw))
+        self._clubs_expires_at = time.monotonic() + _CACHE_TTL
+        return self._clubs
+
+    def invalidate(self) -> None:
+        self._clubs = None
+        self._clubs_expires_at = 0.0
 
     async def get_club_by_id(self, club_id: str) -> dict[str, Any] | None:
         clubs = await self.list_clubs()
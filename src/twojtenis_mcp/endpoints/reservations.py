@@ -1,21 +1,85 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+import asyncio
+import re
+from collections.abc import Awaitable, Iterable
+from datetime import date, time, timedelta
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from ..client import ApiClient
 from ..models import ApiErrorException, Reservation
 from ..router import ApiRouter
 from ..utils import encode_auth0_sub, to_iso_date
 from .clubs import ClubsEndpoint
 
+_RESERVATIONS = TypeAdapter(list[Reservation])
+_HHMM = re.compile(r"\d{2}:\d{2}(:\d{2})?")
+_BOOKING_FIELDS = ("location_id", "location_name", "date", "start_time", "end_time")
+# Upper bound on concurrent upstream calls fanned out from a single tool call.
+_MAX_CONCURRENCY = 8
+
+
+async def _gather_bounded(
+    coros: Iterable[Awaitable[Any]], *, return_exceptions: bool = False
+) -> list[Any]:
+    """asyncio.gather with at most _MAX_CONCURRENCY awaitables in flight."""
+    sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(
+        *(run(c) for c in coros), return_exceptions=return_exceptions
+    )
+
+
+def _slot_error(date: str, start_time: str, end_time: str) -> str | None:
+    """Return why a date/start/end triple is malformed, or None if it is fine."""
+    try:
+        to_iso_date(date)
+    except ValueError as exc:
+        return str(exc)
+    times: list[time] = []
+    for t in (start_time, end_time):
+        if not _HHMM.fullmatch(t):
+            return f"unrecognized time {t!r}; want HH:MM"
+        try:
+            times.append(time.fromisoformat(t))
+        except ValueError:
+            return f"invalid time {t!r}"
+    if times[0] >= times[1]:
+        return f"start_time {start_time!r} must be before end_time {end_time!r}"
+    return None
+
+
+def _created_summary(b: dict[str, Any]) -> dict[str, Any]:
+    """Trim one booking from the POST /bookings response to what tools return."""
+    return {
+        "id": b["id"],
+        "location_id": b.get("locationId"),
+        "location_name": b.get("locationName"),
+        "date": b["date"],
+        "start_time": b["startTime"],
+        "end_time": b["endTime"],
+        "price": b.get("price"),
+    }
+
 
 class ReservationsEndpoint:
     """All booking operations against the new tech-group API."""
 
-    def __init__(self, client: ApiClient, router: ApiRouter) -> None:
+    def __init__(
+        self,
+        client: ApiClient,
+        router: ApiRouter,
+        clubs: ClubsEndpoint | None = None,
+    ) -> None:
         self._client = client
         self._router = router
+        self._clubs = clubs or ClubsEndpoint(client, router)
 
     async def _user_tech_url(self, *, access_token: str) -> str:
         url = self._router.catalog_url("/api/v1/Players/me/technical-groups")
@@ -27,29 +91,44 @@ class ReservationsEndpoint:
             )
         return groups[0]["serviceUrl"].rstrip("/")
 
-    async def get_reservations(
+    async def _my_bookings_raw(
         self, *, access_token: str, from_iso: str, to_iso: str
     ) -> list[dict[str, Any]]:
         tech = await self._user_tech_url(access_token=access_token)
         url = f"{tech}/api/v1/bookings/my"
-        raw = (
+        return (
             await self._client.get(
                 url, access_token=access_token, params={"from": from_iso, "to": to_iso}
             )
             or []
         )
-        return [Reservation.model_validate(r).model_dump(by_alias=False) for r in raw]
+
+    async def get_reservations(
+        self, *, access_token: str, from_iso: str, to_iso: str
+    ) -> list[dict[str, Any]]:
+        raw = await self._my_bookings_raw(
+            access_token=access_token, from_iso=from_iso, to_iso=to_iso
+        )
+        return _RESERVATIONS.dump_python(_RESERVATIONS.validate_python(raw))
 
     async def get_reservation_details(
         self, *, booking_id: str, access_token: str
     ) -> dict[str, Any] | None:
+        """Find one booking in today-30d .. today+90d.
+
+        Only the matching raw record is validated; the rest of the window is
+        never turned into models.
+        """
         today = date.today()
-        all_ = await self.get_reservations(
+        raw = await self._my_bookings_raw(
             access_token=access_token,
             from_iso=(today - timedelta(days=30)).isoformat(),
             to_iso=(today + timedelta(days=90)).isoformat(),
         )
-        return next((r for r in all_ if r["id"] == booking_id), None)
+        match = next((r for r in raw if r.get("id") == booking_id), None)
+        if match is None:
+            return None
+        return Reservation.model_validate(match).model_dump(by_alias=False)
 
     async def delete_reservation(
         self, *, booking_id: str, access_token: str
@@ -62,11 +141,14 @@ class ReservationsEndpoint:
                 "success": False,
                 "message": f"booking {booking_id} not found",
             }
+        await self._cancel(target, access_token=access_token)
+        return {"success": True, "message": "reservation cancelled"}
+
+    async def _cancel(self, booking: dict[str, Any], *, access_token: str) -> None:
         url = await self._router.booking_url(
-            target["club_id"], f"/api/v1/Bookings/my/{booking_id}/cancel"
+            booking["club_id"], f"/api/v1/Bookings/my/{booking['id']}/cancel"
         )
         await self._client.post(url, access_token=access_token, json={})
-        return {"success": True, "message": "reservation cancelled"}
 
     async def _profile(self, *, access_token: str) -> dict[str, Any]:
         url = self._router.catalog_url("/api/v1/Players/me")
@@ -79,6 +161,16 @@ class ReservationsEndpoint:
         url = self._router.catalog_url(f"/api/v1/Clubs/{club_id}/players/{encoded}")
         return await self._client.get(url, access_token=access_token)
 
+    async def _booker(
+        self, *, club_id: str, access_token: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return (profile, club player); the player lookup needs the profile's sub."""
+        profile = await self._profile(access_token=access_token)
+        player = await self._player_in_club(
+            club_id=club_id, auth0_sub=profile["id"], access_token=access_token
+        )
+        return profile, player
+
     async def _calculate_price(
         self,
         *,
@@ -157,6 +249,28 @@ class ReservationsEndpoint:
             "medicoverCardsUsed": 0,
         }
 
+    async def _build_request_items(
+        self,
+        *,
+        club_id: str,
+        court_bookings: list[dict[str, Any]],
+        access_token: str,
+    ) -> list[dict[str, Any]]:
+        # One calculate-price call per item; they are independent, so run them
+        # concurrently. gather keeps the results in court_bookings order.
+        return await _gather_bounded(
+            self._build_request_item(
+                club_id=club_id,
+                location_id=cb["location_id"],
+                location_name=cb["location_name"],
+                date=cb["date"],
+                start_time=cb["start_time"],
+                end_time=cb["end_time"],
+                access_token=access_token,
+            )
+            for cb in court_bookings
+        )
+
     async def make_reservation(
         self,
         *,
@@ -168,22 +282,25 @@ class ReservationsEndpoint:
         end_time: str,
         access_token: str,
     ) -> dict[str, Any]:
-        profile = await self._profile(access_token=access_token)
-        player = await self._player_in_club(
-            club_id=club_id, auth0_sub=profile["id"], access_token=access_token
-        )
-        request_item = await self._build_request_item(
-            club_id=club_id,
-            location_id=location_id,
-            location_name=location_name,
-            date=date,
-            start_time=start_time,
-            end_time=end_time,
-            access_token=access_token,
+        problem = _slot_error(date, start_time, end_time)
+        if problem:
+            raise ApiErrorException("VALIDATION_ERROR", problem)
+        # The price check and club lookup don't depend on who is booking, so
+        # run them alongside the profile -> club-player chain instead of after it.
+        (profile, player), request_item, club_dict = await asyncio.gather(
+            self._booker(club_id=club_id, access_token=access_token),
+            self._build_request_item(
+                club_id=club_id,
+                location_id=location_id,
+                location_name=location_name,
+                date=date,
+                start_time=start_time,
+                end_time=end_time,
+                access_token=access_token,
+            ),
+            self._clubs.get_club_by_id(club_id),
         )
 
-        clubs_ep = ClubsEndpoint(self._client, self._router)
-        club_dict = await clubs_ep.get_club_by_id(club_id)
         club_name = club_dict["name"] if club_dict else ""
         booker_name = f"{profile['firstName']} {profile['lastName']}"
 
@@ -216,14 +333,10 @@ class ReservationsEndpoint:
             "success": True,
             "message": "reservation created",
             "reservation": {
-                "id": b0["id"],
+                **_created_summary(b0),
                 "club_id": club_id,
                 "location_id": location_id,
                 "location_name": b0.get("locationName") or location_name,
-                "date": b0["date"],
-                "start_time": b0["startTime"],
-                "end_time": b0["endTime"],
-                "price": b0.get("price"),
             },
         }
 
@@ -238,25 +351,34 @@ class ReservationsEndpoint:
             raise ApiErrorException(
                 "VALIDATION_ERROR", "court_bookings cannot be empty"
             )
-        profile = await self._profile(access_token=access_token)
-        player = await self._player_in_club(
-            club_id=club_id, auth0_sub=profile["id"], access_token=access_token
-        )
-        items = []
-        for cb in court_bookings:
-            items.append(
-                await self._build_request_item(
-                    club_id=club_id,
-                    location_id=cb["location_id"],
-                    location_name=cb["location_name"],
-                    date=cb["date"],
-                    start_time=cb["start_time"],
-                    end_time=cb["end_time"],
-                    access_token=access_token,
+        # Reject the whole batch before any network call if one item is bad.
+        for i, cb in enumerate(court_bookings):
+            missing = [k for k in _BOOKING_FIELDS if not cb.get(k)]
+            if missing:
+                raise ApiErrorException(
+                    "VALIDATION_ERROR",
+                    f"court_bookings[{i}] is missing {', '.join(missing)}",
                 )
-            )
-        clubs_ep = ClubsEndpoint(self._client, self._router)
-        club_dict = await clubs_ep.get_club_by_id(club_id)
+            not_str = [k for k in _BOOKING_FIELDS if not isinstance(cb[k], str)]
+            if not_str:
+                raise ApiErrorException(
+                    "VALIDATION_ERROR",
+                    f"court_bookings[{i}]: {', '.join(not_str)} must be strings",
+                )
+            problem = _slot_error(cb["date"], cb["start_time"], cb["end_time"])
+            if problem:
+                raise ApiErrorException(
+                    "VALIDATION_ERROR", f"court_bookings[{i}]: {problem}"
+                )
+        (profile, player), items, club_dict = await asyncio.gather(
+            self._booker(club_id=club_id, access_token=access_token),
+            self._build_request_items(
+                club_id=club_id,
+                court_bookings=court_bookings,
+                access_token=access_token,
+            ),
+            self._clubs.get_club_by_id(club_id),
+        )
         booker_name = f"{profile['firstName']} {profile['lastName']}"
         body = {
             "requests": items,
@@ -284,18 +406,7 @@ class ReservationsEndpoint:
         return {
             "success": True,
             "message": f"created {len(created)} reservation(s)",
-            "reservations": [
-                {
-                    "id": b["id"],
-                    "location_id": b["locationId"],
-                    "location_name": b.get("locationName"),
-                    "date": b["date"],
-                    "start_time": b["startTime"],
-                    "end_time": b["endTime"],
-                    "price": b.get("price"),
-                }
-                for b in created
-            ],
+            "reservations": [_created_summary(b) for b in created],
         }
 
     async def delete_all_reservations(self, *, access_token: str) -> dict[str, Any]:
@@ -305,17 +416,18 @@ class ReservationsEndpoint:
             from_iso=today.isoformat(),
             to_iso=(today + timedelta(days=90)).isoformat(),
         )
+        # There is no bulk-cancel endpoint, so issue the cancels concurrently.
+        results = await _gather_bounded(
+            (self._cancel(b, access_token=access_token) for b in bookings),
+            return_exceptions=True,
+        )
         deleted: list[str] = []
         errors: list[dict[str, str]] = []
-        for b in bookings:
-            try:
-                url = await self._router.booking_url(
-                    b["club_id"], f"/api/v1/Bookings/my/{b['id']}/cancel"
-                )
-                await self._client.post(url, access_token=access_token, json={})
+        for b, res in zip(bookings, results, strict=True):
+            if isinstance(res, BaseException):
+                errors.append({"booking_id": b["id"], "error": str(res)})
+            else:
                 deleted.append(b["id"])
-            except Exception as exc:
-                errors.append({"booking_id": b["id"], "error": str(exc)})
         return {
             "success": not errors,
             "message": f"cancelled {len(deleted)} of {len(bookings)} reservations",
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
-from ..availability import build_availability
+from ..availability import build_availability, open_window
 from ..client import ApiClient
 from ..locations import LocationsService
 from ..models import ApiErrorException
@@ -42,33 +43,39 @@ class SchedulesEndpoint:
         locations = details.get("locations") or []
         open_hours = details.get("openHours") or {}
 
-        bookings = (
-            await self._router.booking_get(
+        if open_window(open_hours, iso) is None:
+            # Closed all day: nothing to mark busy, so skip the booking-side calls.
+            return self._result(club_id, iso, [])
+
+        bookings, excludes = await asyncio.gather(
+            self._router.booking_get(
                 club_id,
                 f"/api/v1/Clubs/{club_id}/bookings/public",
                 client=self._client,
                 params={"from": iso, "to": iso},
-            )
-            or []
-        )
-        excludes = (
-            await self._router.booking_get(
+            ),
+            self._router.booking_get(
                 club_id,
                 f"/api/v1/clubs/{club_id}/excludes/public",
                 client=self._client,
                 params={"date": iso},
-            )
-            or []
+            ),
         )
 
         availability = build_availability(
             iso_date=iso,
             locations=locations,
             open_hours=open_hours,
-            bookings=bookings,
-            excludes=excludes,
+            bookings=bookings or [],
+            excludes=excludes or [],
         )
 
+        return self._result(club_id, iso, availability)
+
+    @staticmethod
+    def _result(
+        club_id: str, iso: str, availability: list[dict[str, Any]]
+    ) -> dict[str, Any]:
         return {
             "success": True,
             "message": "schedule fetched",
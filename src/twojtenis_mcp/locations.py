@@ -54,8 +54,7 @@ class LocationsService:
         details = await self.get_club_details(club_id)
         raw = details.get("locations") or []
         locations = [Location.model_validate(item) for item in raw]
-        for loc in locations:
-            self._names[loc.id] = loc.name
+        self._names.update({loc.id: loc.name for loc in locations})
         locations.sort(key=lambda x: (x.sort_number, x.name))
         if sport is not None:
             wanted = sport.strip().lower()
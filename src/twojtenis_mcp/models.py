@@ -36,8 +36,9 @@ SPORT_BY_TAG: dict[str, str] = {
 
 
 def derive_sport(type_value: int, tags: str | None) -> str | None:
-    if type_value in SPORT_BY_TYPE:
-        return SPORT_BY_TYPE[type_value]
+    sport = SPORT_BY_TYPE.get(type_value)
+    if sport is not None:
+        return sport
     if tags:
         for token in tags.split(";"):
             key = token.strip().lower()
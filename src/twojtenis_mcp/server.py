@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import date, timedelta
 from typing import Any
 
@@ -17,7 +20,17 @@ from .router import ApiRouter
 from .tech_group import TechGroupResolver
 from .utils import to_iso_date
 
-mcp = FastMCP("twojtenis-mcp")
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Close the shared HTTP connection pool when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        await _client.aclose()
+
+
+mcp = FastMCP("twojtenis-mcp", lifespan=_lifespan)
 
 _client = ApiClient(main_base=config.catalog_api_url, timeout=config.request_timeout)
 _resolver = TechGroupResolver(_client)
@@ -25,7 +38,7 @@ _router = ApiRouter(catalog_base=config.catalog_api_url, resolver=_resolver)
 _clubs = ClubsEndpoint(_client, _router)
 _locations = LocationsService(_client, _router)
 _schedules = SchedulesEndpoint(_client, _router, _locations)
-_reservations = ReservationsEndpoint(_client, _router)
+_reservations = ReservationsEndpoint(_client, _router, _clubs)
 
 
 def _err(exc: ApiErrorException) -> dict[str, Any]:
@@ -37,16 +50,30 @@ def _err(exc: ApiErrorException) -> dict[str, Any]:
     }
 
 
+def _api_errors(
+    fn: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Turn an ApiErrorException raised by a tool into its `_err` payload."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await fn(*args, **kwargs)
+        except ApiErrorException as exc:
+            return _err(exc)
+
+    return wrapper
+
+
 @mcp.tool()
+@_api_errors
 async def get_all_clubs() -> Any:
     """List all clubs available on TwojTenis. No authentication required."""
-    try:
-        return await _clubs.list_clubs()
-    except ApiErrorException as exc:
-        return _err(exc)
+    return await _clubs.list_clubs()
 
 
 @mcp.tool()
+@_api_errors
 async def get_club_locations(club_id: str, sport: str = "") -> Any:
     """List the bookable courts (locations) at one club. No authentication required.
 
@@ -58,23 +85,19 @@ async def get_club_locations(club_id: str, sport: str = "") -> Any:
 
     Pass `sport` to filter (case-insensitive). E.g. sport="badminton".
     """
-    try:
-        locs = await _locations.locations_for_club(club_id, sport=sport or None)
-        return [loc.model_dump(by_alias=False) for loc in locs]
-    except ApiErrorException as exc:
-        return _err(exc)
+    locs = await _locations.locations_for_club(club_id, sport=sport or None)
+    return [loc.model_dump(by_alias=False) for loc in locs]
 
 
 @mcp.tool()
+@_api_errors
 async def get_club_schedule(club_id: str, date: str) -> dict[str, Any]:
     """Public schedule (occupied slots + excludes) for one club on one day. No authentication required."""
-    try:
-        return await _schedules.get_club_schedule(club_id=club_id, date=date)
-    except ApiErrorException as exc:
-        return _err(exc)
+    return await _schedules.get_club_schedule(club_id=club_id, date=date)
 
 
 @mcp.tool()
+@_api_errors
 async def get_reservations(
     access_token: str, from_date: str = "", to_date: str = ""
 ) -> Any:
@@ -90,30 +113,27 @@ async def get_reservations(
             if to_date
             else (today + timedelta(days=90)).isoformat()
         )
-        return await _reservations.get_reservations(
-            access_token=access_token, from_iso=from_iso, to_iso=to_iso
-        )
-    except ApiErrorException as exc:
-        return _err(exc)
     except ValueError as exc:
         return _err(ApiErrorException("VALIDATION_ERROR", str(exc)))
+    return await _reservations.get_reservations(
+        access_token=access_token, from_iso=from_iso, to_iso=to_iso
+    )
 
 
 @mcp.tool()
+@_api_errors
 async def get_reservation_details(access_token: str, booking_id: str) -> dict[str, Any]:
     """Look up a single booking by ID (searches today-30d .. today+90d)."""
-    try:
-        out = await _reservations.get_reservation_details(
-            booking_id=booking_id, access_token=access_token
-        )
-        if out is None:
-            return {"success": False, "message": "booking not found"}
-        return {"success": True, "reservation": out}
-    except ApiErrorException as exc:
-        return _err(exc)
+    out = await _reservations.get_reservation_details(
+        booking_id=booking_id, access_token=access_token
+    )
+    if out is None:
+        return {"success": False, "message": "booking not found"}
+    return {"success": True, "reservation": out}
 
 
 @mcp.tool()
+@_api_errors
 async def put_reservation(
     access_token: str,
     club_id: str,
@@ -124,21 +144,19 @@ async def put_reservation(
     end_time: str,
 ) -> dict[str, Any]:
     """Create one reservation for the given court (location) and time."""
-    try:
-        return await _reservations.make_reservation(
-            club_id=club_id,
-            location_id=location_id,
-            location_name=location_name,
-            date=date,
-            start_time=start_time,
-            end_time=end_time,
-            access_token=access_token,
-        )
-    except ApiErrorException as exc:
-        return _err(exc)
+    return await _reservations.make_reservation(
+        club_id=club_id,
+        location_id=location_id,
+        location_name=location_name,
+        date=date,
+        start_time=start_time,
+        end_time=end_time,
+        access_token=access_token,
+    )
 
 
 @mcp.tool()
+@_api_errors
 async def put_bulk_reservation(
     access_token: str, club_id: str, court_bookings: list[dict[str, Any]]
 ) -> dict[str, Any]:
@@ -147,54 +165,43 @@ async def put_bulk_reservation(
     Each item in court_bookings:
       {location_id, location_name, date, start_time, end_time}
     """
-    try:
-        return await _reservations.make_bulk_reservation(
-            club_id=club_id,
-            court_bookings=court_bookings,
-            access_token=access_token,
-        )
-    except ApiErrorException as exc:
-        return _err(exc)
+    return await _reservations.make_bulk_reservation(
+        club_id=club_id,
+        court_bookings=court_bookings,
+        access_token=access_token,
+    )
 
 
 @mcp.tool()
+@_api_errors
 async def delete_reservation(access_token: str, booking_id: str) -> dict[str, Any]:
     """Cancel a single reservation by ID."""
-    try:
-        return await _reservations.delete_reservation(
-            booking_id=booking_id, access_token=access_token
-        )
-    except ApiErrorException as exc:
-        return _err(exc)
+    return await _reservations.delete_reservation(
+        booking_id=booking_id, access_token=access_token
+    )
 
 
 @mcp.tool()
+@_api_errors
 async def delete_all_reservations(access_token: str) -> dict[str, Any]:
     """Cancel every future reservation owned by the authenticated user."""
-    try:
-        return await _reservations.delete_all_reservations(access_token=access_token)
-    except ApiErrorException as exc:
-        return _err(exc)
+    return await _reservations.delete_all_reservations(access_token=access_token)
 
 
 @mcp.tool()
+@_api_errors
 async def login_oauth(email: str, password: str) -> dict[str, Any]:
     """Drive an Auth0 headless-browser login and return a JWT access_token."""
-    try:
-        result = await oauth_endpoint.login(email, password)
-        return {"success": True, **result}
-    except ApiErrorException as exc:
-        return _err(exc)
+    result = await oauth_endpoint.login(email, password)
+    return {"success": True, **result}
 
 
 @mcp.tool()
+@_api_errors
 async def refresh_oauth_token(refresh_token: str) -> dict[str, Any]:
     """Exchange a refresh_token for a new access_token (no browser)."""
-    try:
-        result = await oauth_endpoint.refresh(refresh_token)
-        return {"success": True, **result}
-    except ApiErrorException as exc:
-        return _err(exc)
+    result = await oauth_endpoint.refresh(refresh_token)
+    return {"success": True, **result}
 
 
 def main() -> None:
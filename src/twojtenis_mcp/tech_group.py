@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import random
 import time
 from dataclasses import dataclass
 
@@ -12,9 +13,18 @@ from .models import TechnicalGroup
 logger = logging.getLogger(__name__)
 
 _CACHE_TTL = float(os.environ.get("TWOJTENIS_TECH_GROUP_CACHE_TTL", "3600"))
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
 
 
-@dataclass
+def _retry_delay(attempt: int) -> float:
+    """Capped exponential backoff with ±50% jitter, so lookups that failed
+    together don't all retry in lockstep."""
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+@dataclass(slots=True, frozen=True)
 class _CacheEntry:
     url: str
     expires_at: float  # time.monotonic()
@@ -32,15 +42,37 @@ class TechGroupResolver:
     def __init__(self, client: ApiClient) -> None:
         self._client = client
         self._cache: dict[str, _CacheEntry] = {}
+        self._inflight: dict[str, asyncio.Task[str]] = {}
 
-    async def service_url_for_club(self, club_id: str) -> str:
+    def _cached(self, club_id: str) -> str | None:
         entry = self._cache.get(club_id)
         if entry is not None and time.monotonic() < entry.expires_at:
             return entry.url
+        return None
+
+    async def service_url_for_club(self, club_id: str) -> str:
+        cached = self._cached(club_id)
+        if cached is not None:
+            return cached
+
+        # Concurrent misses for the same club await one in-flight lookup and
+        # share its outcome, so a failing upstream sees a single retry sequence
+        # rather than one per waiter.
+        task = self._inflight.get(club_id)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve_shared(club_id))
+            self._inflight[club_id] = task
+        return await asyncio.shield(task)
+
+    async def _resolve_shared(self, club_id: str) -> str:
+        try:
+            return await self._resolve(club_id)
+        finally:
+            self._inflight.pop(club_id, None)
 
+    async def _resolve(self, club_id: str) -> str:
         url = f"{self._client.main_base}/api/v1/Clubs/{club_id}/technical-group"
         last_exc: BaseException | None = None
-        delays = [1, 2]  # sleep between attempt 1→2 and 2→3
 
         for attempt in range(3):
             try:
@@ -61,7 +93,7 @@ class TechGroupResolver:
                         club_id,
                         exc,
                     )
-                    await asyncio.sleep(delays[attempt])
+                    await asyncio.sleep(_retry_delay(attempt))
 
         logger.warning(
             "tech-group resolution failed for club %s: %s", club_id, last_exc
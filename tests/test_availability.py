@@ -1,5 +1,6 @@
 from twojtenis_mcp.availability import (
     SLOT_MINUTES,
+    _busy_mask,
     _interval_overlap,
     _slots_for_window,
     build_availability,
@@ -147,3 +148,50 @@ def test_clubwide_exclude_blocks_all_locations():
     for court in grid:
         slots = {s["start"]: s["available"] for s in court["slots"]}
         assert slots == {"09:00": False, "09:30": True}
+
+
+def test_exclude_with_location_list_blocks_only_listed_courts():
+    locations = [
+        {"id": "loc-1", "name": "A", "type": 0, "isEnabled": True},
+        {"id": "loc-2", "name": "B", "type": 0, "isEnabled": True},
+        {"id": "loc-3", "name": "C", "type": 0, "isEnabled": True},
+    ]
+    open_hours = {"monday": {"from": "09:00:00", "to": "10:00:00"}}
+    excludes = [
+        {
+            "locations": ["loc-1", "loc-3"],
+            "startHour": "09:30:00",
+            "endHour": "10:00:00",
+        }
+    ]
+    grid = build_availability(
+        iso_date="2026-05-11",
+        locations=locations,
+        open_hours=open_hours,
+        bookings=[{"locationId": "loc-2", "startTime": "09:00", "endTime": "09:30"}],
+        excludes=excludes,
+    )
+    by_loc = {
+        c["location_id"]: {s["start"]: s["available"] for s in c["slots"]} for c in grid
+    }
+    assert by_loc["loc-1"] == {"09:00": True, "09:30": False}
+    assert by_loc["loc-2"] == {"09:00": False, "09:30": True}
+    assert by_loc["loc-3"] == {"09:00": True, "09:30": False}
+
+
+def test_busy_mask_matches_interval_overlap():
+    window_start, n = 9 * 60, 6  # 09:00 .. 12:00
+    slots = _slots_for_window(window_start, window_start + n * SLOT_MINUTES)
+    intervals = [
+        (540, 570),
+        (555, 600),
+        (500, 545),
+        (690, 800),
+        (0, 540),
+        (720, 780),
+        (545, 546),
+    ]
+    for b_start, b_end in intervals:
+        mask = _busy_mask([(b_start, b_end)], window_start, n)
+        expected = [_interval_overlap(s, e, b_start, b_end) for s, e in slots]
+        assert [bool((mask >> i) & 1) for i in range(n)] == expected
@@ -77,3 +77,25 @@ async def test_5xx_maps_to_http_error(monkeypatch):
     with pytest.raises(ApiErrorException) as ei:
         await c.get("https://main.example/x", access_token="t")
     assert ei.value.code == "HTTP_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_reuses_one_http_client_until_closed(monkeypatch):
+    seen: list[int] = []
+
+    async def fake_send(self, req, **kw):
+        seen.append(id(self))
+        return httpx.Response(200, json={}, request=req)
+
+    monkeypatch.setattr(httpx.AsyncClient, "send", fake_send)
+    c = ApiClient(main_base="https://main.example", timeout=5)
+    await c.get("https://main.example/a", access_token=None)
+    await c.get("https://main.example/b", access_token=None)
+    assert seen[0] == seen[1]
+    first = c._http
+    await c.aclose()
+    await c.get("https://main.example/c", access_token=None)
+    assert len(seen) == 3
+    assert first is not None and first.is_closed
+    assert c._http is not None and not c._http.is_closed
+    await c.aclose()
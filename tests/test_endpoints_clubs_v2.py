@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 
 from twojtenis_mcp.client import ApiClient
 from twojtenis_mcp.endpoints.clubs import ClubsEndpoint
+from twojtenis_mcp.models import ApiErrorException
 from twojtenis_mcp.router import ApiRouter
 from twojtenis_mcp.tech_group import TechGroupResolver
 
@@ -117,6 +120,78 @@ async def test_get_club_by_id(monkeypatch):
     assert await ep.get_club_by_id("missing") is None
 
 
+@pytest.mark.asyncio
+async def test_list_clubs_cached_and_served_stale_on_failure(monkeypatch):
+    calls = 0
+
+    async def fake_get(self, url, *, access_token, params=None):
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise ApiErrorException("REQUEST_FAILED", "down")
+        return []
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    client = ApiClient(main_base="https://main")
+    router = ApiRouter(catalog_base="https://main", resolver=TechGroupResolver(client))
+    ep = ClubsEndpoint(client, router)
+    clubs = await ep.list_clubs()
+    assert clubs == []
+    clubs.append({"id": "junk"})  # callers get a copy, not the cache
+    assert await ep.list_clubs() == []
+    assert calls == 1
+
+    ep._clubs_expires_at = 0.0  # force expiry
+    assert await ep.list_clubs() == []  # refresh fails, stale list returned
+    assert calls == 2
+    assert await ep.list_clubs() == []  # retry deferred, no upstream call
+    assert calls == 2
+
+    ep.invalidate()
+    with pytest.raises(ApiErrorException):
+        await ep.list_clubs()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_club_lookups_share_one_fetch(monkeypatch):
+    calls = 0
+
+    async def fake_get(self, url, *, access_token, params=None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return []
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    client = ApiClient(main_base="https://main")
+    router = ApiRouter(catalog_base="https://main", resolver=TechGroupResolver(client))
+    ep = ClubsEndpoint(client, router)
+    found = await asyncio.gather(*(ep.get_club_by_id("u1") for _ in range(5)))
+    assert found == [None] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_club_lookups_share_one_failed_fetch(monkeypatch):
+    calls = 0
+
+    async def fake_get(self, url, *, access_token, params=None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise ApiErrorException("REQUEST_FAILED", "down")
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    client = ApiClient(main_base="https://main")
+    router = ApiRouter(catalog_base="https://main", resolver=TechGroupResolver(client))
+    ep = ClubsEndpoint(client, router)
+    results = await asyncio.gather(
+        *(ep.list_clubs() for _ in range(5)), return_exceptions=True
+    )
+    assert all(isinstance(exc, ApiErrorException) for exc in results)
+    assert calls == 1
+
+
 @pytest.mark.asyncio
 async def test_get_club_details_passthrough(monkeypatch):
     async def fake_get(self, url, *, access_token, params=None):
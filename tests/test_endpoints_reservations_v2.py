@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 
 from twojtenis_mcp.client import ApiClient
-from twojtenis_mcp.endpoints.reservations import ReservationsEndpoint
+from twojtenis_mcp.endpoints.reservations import _MAX_CONCURRENCY, ReservationsEndpoint
+from twojtenis_mcp.models import ApiErrorException
 from twojtenis_mcp.router import ApiRouter
 from twojtenis_mcp.tech_group import TechGroupResolver
 
@@ -39,8 +42,27 @@ SAMPLE_BOOKING = {
 }
 
 
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Install fake ApiClient.get/post; monkeypatch undoes them after each test."""
+
+    def _install(*, get=None, post=None):
+        if get is not None:
+            monkeypatch.setattr(ApiClient, "get", get)
+        if post is not None:
+            monkeypatch.setattr(ApiClient, "post", post)
+
+    return _install
+
+
+def _endpoint() -> ReservationsEndpoint:
+    client = ApiClient(main_base="https://main")
+    router = ApiRouter(catalog_base="https://main", resolver=TechGroupResolver(client))
+    return ReservationsEndpoint(client, router)
+
+
 @pytest.mark.asyncio
-async def test_get_reservations(monkeypatch):
+async def test_get_reservations(fake_api):
     async def fake_get(self, url, *, access_token, params=None):
         if "/technical-groups" in url:
             return [{"id": "TG", "serviceUrl": "https://tech", "name": "TG"}]
@@ -48,11 +70,8 @@ async def test_get_reservations(monkeypatch):
             return [SAMPLE_BOOKING]
         raise AssertionError(url)
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get)
+    ep = _endpoint()
     out = await ep.get_reservations(
         access_token="t", from_iso="2026-05-01", to_iso="2026-05-31"
     )
@@ -62,7 +81,7 @@ async def test_get_reservations(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_delete_reservation(monkeypatch):
+async def test_delete_reservation(fake_api):
     seen: list[tuple[str, dict | None]] = []
 
     async def fake_get(self, url, *, access_token, params=None):
@@ -78,12 +97,8 @@ async def test_delete_reservation(monkeypatch):
         seen.append((url, json))
         return None
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    monkeypatch.setattr(ApiClient, "post", fake_post)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get, post=fake_post)
+    ep = _endpoint()
     out = await ep.delete_reservation(booking_id="b1", access_token="t")
     assert out["success"] is True
     assert seen[0][0].endswith("/api/v1/Bookings/my/b1/cancel")
@@ -91,7 +106,7 @@ async def test_delete_reservation(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_reservation_details_returns_match(monkeypatch):
+async def test_get_reservation_details_returns_match(fake_api):
     async def fake_get(self, url, *, access_token, params=None):
         if "/technical-groups" in url:
             return [{"id": "TG", "serviceUrl": "https://tech", "name": "TG"}]
@@ -99,11 +114,8 @@ async def test_get_reservation_details_returns_match(monkeypatch):
             return [SAMPLE_BOOKING]
         raise AssertionError(url)
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get)
+    ep = _endpoint()
     found = await ep.get_reservation_details(booking_id="b1", access_token="t")
     assert found is not None
     assert found["id"] == "b1"
@@ -112,7 +124,7 @@ async def test_get_reservation_details_returns_match(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_delete_reservation_when_missing(monkeypatch):
+async def test_delete_reservation_when_missing(fake_api):
     async def fake_get(self, url, *, access_token, params=None):
         if "/technical-groups" in url:
             return [{"id": "TG", "serviceUrl": "https://tech", "name": "TG"}]
@@ -120,17 +132,14 @@ async def test_delete_reservation_when_missing(monkeypatch):
             return []
         raise AssertionError(url)
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get)
+    ep = _endpoint()
     out = await ep.delete_reservation(booking_id="ghost", access_token="t")
     assert out["success"] is False
 
 
 @pytest.mark.asyncio
-async def test_delete_all(monkeypatch):
+async def test_delete_all(fake_api):
     cancels: list[str] = []
 
     async def fake_get(self, url, *, access_token, params=None):
@@ -149,12 +158,8 @@ async def test_delete_all(monkeypatch):
         cancels.append(url)
         return None
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    monkeypatch.setattr(ApiClient, "post", fake_post)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get, post=fake_post)
+    ep = _endpoint()
     out = await ep.delete_all_reservations(access_token="t")
     assert out["success"] is True
     assert out["deleted_count"] == 2
@@ -162,6 +167,35 @@ async def test_delete_all(monkeypatch):
     assert len(cancels) == 2
 
 
+@pytest.mark.asyncio
+async def test_delete_all_cancels_concurrently_within_bound(fake_api):
+    bookings = [{**SAMPLE_BOOKING, "id": f"b{i}"} for i in range(20)]
+    in_flight = peak = 0
+
+    async def fake_get(self, url, *, access_token, params=None):
+        if "/technical-groups" in url:
+            return [{"id": "TG", "serviceUrl": "https://tech", "name": "TG"}]
+        if "/bookings/my" in url:
+            return bookings
+        if "/technical-group" in url:
+            return {"id": "TG", "serviceUrl": "https://tech", "name": "TG"}
+        raise AssertionError(url)
+
+    async def fake_post(self, url, *, access_token, json=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return None
+
+    fake_api(get=fake_get, post=fake_post)
+    out = await _endpoint().delete_all_reservations(access_token="t")
+    assert out["deleted_count"] == 20
+    assert sorted(out["deleted_booking_ids"]) == sorted(b["id"] for b in bookings)
+    assert 1 < peak <= _MAX_CONCURRENCY
+
+
 def _open_hours_all_day():
     return {
         d: {"from": "07:00:00", "to": "23:00:00"}
@@ -231,6 +265,13 @@ PRICE = {
         }
     ],
 }
+COURT_BOOKING = {
+    "location_id": "loc",
+    "location_name": "Badminton 2",
+    "date": "2026-05-11",
+    "start_time": "16:00",
+    "end_time": "17:00",
+}
 CLUB = {
     "id": "c",
     "name": "Klub",
@@ -256,7 +297,7 @@ CLUB = {
 
 
 @pytest.mark.asyncio
-async def test_make_reservation(monkeypatch):
+async def test_make_reservation(fake_api):
     captured: dict[str, dict] = {}
 
     async def fake_get(self, url, *, access_token, params=None):
@@ -279,12 +320,8 @@ async def test_make_reservation(monkeypatch):
             return [{**SAMPLE_BOOKING, "id": "new-id"}]
         raise AssertionError(url)
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    monkeypatch.setattr(ApiClient, "post", fake_post)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get, post=fake_post)
+    ep = _endpoint()
     out = await ep.make_reservation(
         club_id="c",
         location_id="loc",
@@ -308,7 +345,7 @@ async def test_make_reservation(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_make_bulk_reservation_sends_one_post_with_two_items(monkeypatch):
+async def test_make_bulk_reservation_sends_one_post_with_two_items(fake_api):
     captured: dict[str, dict] = {}
 
     async def fake_get(self, url, *, access_token, params=None):
@@ -334,29 +371,13 @@ async def test_make_bulk_reservation_sends_one_post_with_two_items(monkeypatch):
             ]
         raise AssertionError(url)
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
-    monkeypatch.setattr(ApiClient, "post", fake_post)
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    fake_api(get=fake_get, post=fake_post)
+    ep = _endpoint()
     out = await ep.make_bulk_reservation(
         club_id="c",
         court_bookings=[
-            {
-                "location_id": "loc",
-                "location_name": "Badminton 2",
-                "date": "2026-05-11",
-                "start_time": "16:00",
-                "end_time": "17:00",
-            },
-            {
-                "location_id": "loc",
-                "location_name": "Badminton 2",
-                "date": "2026-05-11",
-                "start_time": "17:00",
-                "end_time": "18:00",
-            },
+            COURT_BOOKING,
+            {**COURT_BOOKING, "start_time": "17:00", "end_time": "18:00"},
         ],
         access_token="t",
     )
@@ -370,12 +391,93 @@ async def test_make_bulk_reservation_sends_one_post_with_two_items(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_make_bulk_reservation_rejects_empty():
-    from twojtenis_mcp.models import ApiErrorException
-
-    client = ApiClient(main_base="https://main")
-    resolver = TechGroupResolver(client)
-    router = ApiRouter(catalog_base="https://main", resolver=resolver)
-    ep = ReservationsEndpoint(client, router)
+    ep = _endpoint()
     with pytest.raises(ApiErrorException) as ei:
         await ep.make_bulk_reservation(club_id="c", court_bookings=[], access_token="t")
     assert ei.value.code == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_make_bulk_reservation_rejects_bad_item_before_network(fake_api):
+    async def fake_get(self, url, *, access_token, params=None):
+        raise AssertionError(url)
+
+    fake_api(get=fake_get)
+    ep = _endpoint()
+    good = COURT_BOOKING
+    with pytest.raises(ApiErrorException) as ei:
+        await ep.make_bulk_reservation(
+            club_id="c",
+            court_bookings=[good, {**good, "start_time": "4pm"}],
+            access_token="t",
+        )
+    assert ei.value.code == "VALIDATION_ERROR"
+    assert "court_bookings[1]" in ei.value.message
+
+    with pytest.raises(ApiErrorException) as ei:
+        await ep.make_bulk_reservation(
+            club_id="c",
+            court_bookings=[{k: v for k, v in good.items() if k != "date"}],
+            access_token="t",
+        )
+    assert "missing date" in ei.value.message
+
+    with pytest.raises(ApiErrorException) as ei:
+        await ep.make_bulk_reservation(
+            club_id="c",
+            court_bookings=[good, {**good, "start_time": 1600, "date": 20260511}],
+            access_token="t",
+        )
+    assert ei.value.code == "VALIDATION_ERROR"
+    assert ei.value.message == "court_bookings[1]: date, start_time must be strings"
+
+
+@pytest.mark.asyncio
+async def test_make_reservation_rejects_bad_date_before_network(fake_api):
+    async def fake_get(self, url, *, access_token, params=None):
+        raise AssertionError(url)
+
+    fake_api(get=fake_get)
+    ep = _endpoint()
+    with pytest.raises(ApiErrorException) as ei:
+        await ep.make_reservation(
+            club_id="c",
+            location_id="loc",
+            location_name="Badminton 2",
+            date="31.02.2026",
+            start_time="16:00",
+            end_time="17:00",
+            access_token="t",
+        )
+    assert ei.value.code == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("start_time", "end_time"),
+    [
+        ("16:00\n", "17:00"),
+        ("99:99", "17:00"),
+        ("16:00", "16:00"),
+        ("17:00", "16:00"),
+    ],
+)
+async def test_make_reservation_rejects_bad_time_before_network(
+    fake_api, start_time, end_time
+):
+    async def fake_get(self, url, *, access_token, params=None):
+        raise AssertionError(url)
+
+    fake_api(get=fake_get)
+    ep = _endpoint()
+    with pytest.raises(ApiErrorException) as ei:
+        await ep.make_reservation(
+            club_id="c",
+            location_id="loc",
+            location_name="Badminton 2",
+            date="11.05.2026",
+            start_time=start_time,
+            end_time=end_time,
+            access_token="t",
+        )
+    assert ei.value.code == "VALIDATION_ERROR"
@@ -133,3 +133,22 @@ async def test_club_details_cached_across_calls(monkeypatch):
     # Same LocationsService instance also serves get_club_locations
     await locations.locations_for_club("c")
     assert detail_fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_closed_day_skips_booking_fetches(monkeypatch):
+    details = {**CLUB_DETAILS, "openHours": {"monday": {"from": None, "to": None}}}
+
+    async def fake_get(self, url, *, access_token, params=None):
+        if url.endswith("/api/v1/Clubs/c"):
+            return details
+        raise AssertionError(url)
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    client = ApiClient(main_base="https://main.example")
+    resolver = TechGroupResolver(client)
+    router = ApiRouter(catalog_base="https://main.example", resolver=resolver)
+    ep = SchedulesEndpoint(client, router, LocationsService(client, router))
+    out = await ep.get_club_schedule(club_id="c", date="2026-05-11")
+    assert out["success"] is True
+    assert out["data"]["availability"] == []
@@ -3,12 +3,8 @@
 import base64
 import hashlib
 import os
-import sys
 import time
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 import pytest
 
 from twojtenis_mcp.models import ApiErrorException
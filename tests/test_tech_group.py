@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from twojtenis_mcp.client import ApiClient
@@ -35,3 +37,67 @@ async def test_invalidate_clears_cache(monkeypatch):
     r.invalidate("c")
     await r.service_url_for_club("c")
     assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_lookup(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_get(self, url, *, access_token, params=None):
+        calls.append(url)
+        await asyncio.sleep(0)
+        return {"id": "TechGrp1", "serviceUrl": "https://tech.example", "name": "TG1"}
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    r = TechGroupResolver(ApiClient(main_base="https://main.example"))
+    urls = await asyncio.gather(*(r.service_url_for_club("c") for _ in range(5)))
+    assert urls == ["https://tech.example"] * 5
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_with_jittered_backoff_then_raises(monkeypatch):
+    from twojtenis_mcp import tech_group
+
+    async def fake_get(self, url, *, access_token, params=None):
+        raise RuntimeError("down")
+
+    slept: list[float] = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    monkeypatch.setattr(tech_group.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(tech_group.random, "uniform", lambda a, b: b)
+    r = TechGroupResolver(ApiClient(main_base="https://main.example"))
+    with pytest.raises(RuntimeError):
+        await r.service_url_for_club("c")
+    assert slept == [1.5, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_failed_lookup(monkeypatch):
+    from twojtenis_mcp import tech_group
+
+    calls: list[str] = []
+
+    async def fake_get(self, url, *, access_token, params=None):
+        calls.append(url)
+        raise RuntimeError("down")
+
+    slept: list[float] = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    monkeypatch.setattr(tech_group.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(tech_group.random, "uniform", lambda a, b: b)
+    r = TechGroupResolver(ApiClient(main_base="https://main.example"))
+    results = await asyncio.gather(
+        *(r.service_url_for_club("c") for _ in range(5)), return_exceptions=True
+    )
+    assert all(isinstance(exc, RuntimeError) for exc in results)
+    assert len(calls) == 3
+    assert slept == [1.5, 3.0]
@@ -3,22 +3,30 @@ import pytest
 from twojtenis_mcp.utils import encode_auth0_sub, from_iso_date, to_iso_date
 
 
-def test_to_iso_from_dd_mm_yyyy():
-    assert to_iso_date("11.05.2026") == "2026-05-11"
-
-
-def test_to_iso_passthrough_iso():
-    assert to_iso_date("2026-05-11") == "2026-05-11"
-
-
-def test_to_iso_invalid():
-    with pytest.raises(ValueError):
-        to_iso_date("garbage")
-
-
-def test_to_iso_invalid_iso_calendar():
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("11.05.2026", "2026-05-11"),
+        ("2026-05-11", "2026-05-11"),  # already ISO: passthrough
+        ("29.02.2028", "2028-02-29"),  # leap day
+    ],
+)
+def test_to_iso(raw, expected):
+    assert to_iso_date(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "garbage",
+        "2026-13-40",  # right shape, impossible calendar date
+        "31.02.2026",
+        "29.02.2026",  # not a leap year
+    ],
+)
+def test_to_iso_invalid(raw):
     with pytest.raises(ValueError):
-        to_iso_date("2026-13-40")
+        to_iso_date(raw)
 
 
 def test_from_iso():